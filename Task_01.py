@@ -1,73 +1,146 @@
+import json
+import os
 import pickle
+import re
+import sys
+from calendar import isleap
 from collections import UserDict
-from datetime import datetime, timedelta
-
-class Field:
-    def __init__(self, value):
-        self.value = value
-
-    def __str__(self):
-        return str(self.value)
-
-class Name(Field):
-    def __init__(self, name):
-        self.name = name
-
-class Phone(Field):
-    def __init__(self, number):
-        if len(number) != 10 or not number.isdigit():
-            raise ValueError("Phone number must be 10 digits.")
-        self.number = number
-
-class Birthday(Field):
-    def __init__(self, value):
-        try:
-            self.date = datetime.strptime(value, "%d.%m.%Y")
-        except ValueError:
-            raise ValueError("Invalid date format. Use DD.MM.YYYY")
-        self.value = value
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+
+def _validate_phone(number):
+    if len(number) != 10 or not number.isdigit():
+        raise ValueError("Phone number must be 10 digits.")
+    return number
+
+# Та сама граматика, що й у strptime("%d.%m.%Y"), разом з днем, доповненим пробілом
+_BIRTHDAY_RE = re.compile(r"(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])\.(1[0-2]|0[1-9]|[1-9])\.(\d{4})").fullmatch
+
+def _parse_birthday(value):
+    match = _BIRTHDAY_RE(value)
+    if not match:
+        raise ValueError("Invalid date format. Use DD.MM.YYYY")
+    day, month, year = map(int, match.groups())
+    try:
+        date(year, month, day)
+    except ValueError:
+        raise ValueError("Invalid date format. Use DD.MM.YYYY")
+    return month, day
 
 class Record:
+    __slots__ = ("name", "phones", "birthday", "bday_md", "_owners")
+
     def __init__(self, name, *phones, birthday=None):
-        self.name = Name(name)
-        self.phones = [Phone(phone) for phone in phones]
-        self.birthday = Birthday(birthday) if birthday else None
+        self.name = name
+        # (id книги, ключ) -> AddressBook, що зберігає цей запис
+        self._owners = {}
+        # Найчастіше контакт має один номер або жодного
+        if not phones:
+            self.phones = []
+        elif len(phones) == 1:
+            self.phones = [_validate_phone(phones[0])]
+        else:
+            self.phones = [_validate_phone(phone) for phone in phones]
+        self.birthday = None
+        self.bday_md = None
+        if birthday:
+            self.add_birthday(birthday)
 
     def add_phone(self, phone):
-        self.phones.append(Phone(phone))
+        self.phones.append(_validate_phone(phone))
 
     def remove_phone(self, phone):
-        self.phones = [p for p in self.phones if p.number != phone]
+        # Видаляємо всі копії номера на місці, йдучи з кінця списку
+        phones = self.phones
+        for i in range(len(phones) - 1, -1, -1):
+            if phones[i] == phone:
+                del phones[i]
 
     def edit_phone(self, old_phone, new_phone):
-        for p in self.phones:
-            if p.number == old_phone:
-                p.number = new_phone
-                break
-        else:
-            raise ValueError(f"Phone '{old_phone}' not found for contact '{self.name.name}'.")
+        _validate_phone(new_phone)
+        try:
+            self.phones[self.phones.index(old_phone)] = new_phone
+        except ValueError:
+            raise ValueError(f"Phone '{old_phone}' not found for contact '{self.name}'.")
 
     def find_phone(self, phone):
-        for p in self.phones:
-            if p.number == phone:
-                return p
-        return None
+        return phone if phone in self.phones else None
 
     def add_birthday(self, birthday):
-        self.birthday = Birthday(birthday)
+        self.bday_md = _parse_birthday(birthday)
+        self.birthday = birthday
+        # Повідомляємо книги, щоб вони оновили індекс днів народження
+        for (_, name), book in list(self._owners.items()):
+            book._reindex_birthday(name)
 
 class AddressBook(UserDict):
+    def __init__(self, *args, **kwargs):
+        # (місяць, день) -> імена контактів з днем народження цього дня
+        self._bday_index = {}
+        # ім'я -> (місяць, день), під яким контакт записано в індекс
+        self._indexed_md = {}
+        super().__init__(*args, **kwargs)
+
+    # UserDict проводить усі зміни через __setitem__/__delitem__,
+    # тож індекс днів народження оновлюється тут
+    def __setitem__(self, name, record):
+        # Інтернуємо лише звичайні рядки: sys.intern не приймає інші типи
+        if type(name) is str:
+            name = sys.intern(name)
+        old_record = self.data.get(name)
+        if old_record is not None:
+            old_record._owners.pop((id(self), name), None)
+        self._unindex_birthday(name)
+        self.data[name] = record
+        record._owners[(id(self), name)] = self
+        self._index_birthday(name, record)
+
+    def __delitem__(self, name):
+        record = self.data.pop(name)
+        record._owners.pop((id(self), name), None)
+        self._unindex_birthday(name)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def copy(self):
+        return self.__class__(self.data)
+
+    __copy__ = copy
+
+    def _index_birthday(self, name, record):
+        if record.bday_md:
+            self._bday_index.setdefault(record.bday_md, []).append(name)
+            self._indexed_md[name] = record.bday_md
+
+    def _reindex_birthday(self, name):
+        self._unindex_birthday(name)
+        record = self.data.get(name)
+        if record is not None:
+            self._index_birthday(name, record)
+
+    def _unindex_birthday(self, name):
+        month_day = self._indexed_md.pop(name, None)
+        if month_day is None:
+            return
+        names = self._bday_index[month_day]
+        names.remove(name)
+        if not names:
+            del self._bday_index[month_day]
+
     def add_record(self, record):
-        self.data[record.name.name] = record
+        self[record.name] = record
 
     def delete_record(self, name):
-        del self.data[name]
+        del self[name]
+
+    def names_with_birthday(self, month_day):
+        return tuple(self._bday_index.get(month_day, ()))
 
     def find_record(self, name):
-        if name in self.data:
-            return self.data[name]
-        else:
-            return None
+        return self.data.get(name)
 
     def add_phone(self, name, phone):
         record = self.find_record(name)
@@ -97,6 +170,27 @@ class AddressBook(UserDict):
         else:
             raise KeyError(f"Contact '{name}' not found in the address book.")
 
+    def to_plain(self):
+        return [
+            {
+                "name": record.name,
+                "phones": list(record.phones),
+                "birthday": record.birthday,
+            }
+            for record in self.data.values()
+        ]
+
+    @classmethod
+    def from_plain(cls, data):
+        book = cls()
+        for item in data:
+            # Збережені номери вже перевірялися під час введення, тож не перевіряємо
+            # їх вдруге: старі файли могли містити номери, що не пройдуть перевірку
+            record = Record(item["name"], birthday=item["birthday"])
+            record.phones = list(item["phones"])
+            book.add_record(record)
+        return book
+
 def input_error(func):
     def wrapper(*args, **kwargs):
         try:
@@ -120,7 +214,7 @@ def change_contact(address_book, name, old_number, new_number):
 def show_phone(address_book, name):
     record = address_book.find_record(name)
     if record:
-        print(f"The phone number(s) for '{name}' is/are {', '.join([p.number for p in record.phones])}.")
+        print(f"The phone number(s) for '{name}' is/are {', '.join(record.phones)}.")
     else:
         print(f"No phone number found for contact '{name}'.")
 
@@ -128,9 +222,9 @@ def show_phone(address_book, name):
 def show_all_contacts(address_book):
     print("All contacts in the address book:")
     for name, record in address_book.items():
-        print(f"{name}: {', '.join([p.number for p in record.phones])}")
+        print(name, ", ".join(record.phones), sep=": ")
         if record.birthday:
-            print(f"Birthday: {record.birthday.value}")
+            print("Birthday", record.birthday, sep=": ")
 
 @input_error
 def add_contact_birthday(address_book, name, birthday):
@@ -141,115 +235,171 @@ def add_contact_birthday(address_book, name, birthday):
 def show_birthday(address_book, name):
     record = address_book.find_record(name)
     if record and record.birthday:
-        print(f"The birthday for '{name}' is {record.birthday.value}.")
+        print(f"The birthday for '{name}' is {record.birthday}.")
     else:
         print(f"No birthday found for contact '{name}'.")
 
-def get_upcoming_birthdays(address_book, days=7):
-    today = datetime.today().date()
-    upcoming_birthdays = []
-
-    for record in address_book.values():
-        if record.birthday:
-            birthday = record.birthday.date.date()
-            birthday_this_year = birthday.replace(year=today.year)
-            if birthday_this_year < today:
-                birthday_this_year = birthday_this_year.replace(year=today.year + 1)
+def say_hello(address_book):
+    print("How can I help you?")
 
-            days_until_birthday = (birthday_this_year - today).days
+def show_upcoming_birthdays(address_book):
+    upcoming_birthdays = get_upcoming_birthdays(address_book)
+    if upcoming_birthdays:
+        print("Upcoming birthdays in the next 7 days:")
+        for birthday in upcoming_birthdays:
+            print(f"{birthday['name']} has a birthday on {birthday['congratulation_date']}")
+    else:
+        print("No upcoming birthdays in the next 7 days.")
+
+# Зсув на понеділок для суботи та неділі, індекс - weekday()
+_SHIFT_TD = (timedelta(0),) * 5 + (timedelta(days=2), timedelta(days=1))
+
+@lru_cache(maxsize=8)
+def _birthday_window(today_ord, days):
+    # (місяць, день) -> дата привітання для кожного дня вікна
+    window = {}
+    for birthday_ord in range(today_ord, today_ord + days + 1):
+        day = date.fromordinal(birthday_ord)
+        congratulation_date = (day + _SHIFT_TD[day.weekday()]).strftime("%Y.%m.%d")
+        window.setdefault((day.month, day.day), congratulation_date)
+        if day.month == 3 and day.day == 1 and not isleap(day.year):
+            window.setdefault((2, 29), congratulation_date)
+    # Результат кешується і спільний для всіх викликів, тому лише для читання
+    return MappingProxyType(window)
 
-            if days_until_birthday <= days:
-                weekday = birthday_this_year.weekday()
-                if weekday == 5:  # Субота
-                    birthday_this_year += timedelta(days=2)
-                elif weekday == 6:  # Неділя
-                    birthday_this_year += timedelta(days=1)
+def get_upcoming_birthdays(address_book, days=7):
+    window = _birthday_window(datetime.today().date().toordinal(), days)
+    upcoming_birthdays = []
 
-                upcoming_birthdays.append({
-                    "name": record.name.name,
-                    "congratulation_date": birthday_this_year.strftime("%Y.%m.%d")
-                })
+    for month_day, congratulation_date in window.items():
+        for name in address_book.names_with_birthday(month_day):
+            upcoming_birthdays.append({
+                "name": name,
+                "congratulation_date": congratulation_date
+            })
 
     return upcoming_birthdays
 
-def save_data(book, filename="addressbook.pkl"):
-    with open(filename, "wb") as f:
-        pickle.dump(book, f)
-
-def load_data(filename="addressbook.pkl"):
+def save_data(book, filename="addressbook.json"):
+    # Пишемо у тимчасовий файл і підміняємо, щоб збій не зіпсував дані
+    tmp_filename = filename + ".tmp"
     try:
-        with open(filename, "rb") as f:
-            return pickle.load(f)
-    except FileNotFoundError:
+        with open(tmp_filename, "w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(book.to_plain(), f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        try:
+            os.unlink(tmp_filename)
+        except FileNotFoundError:
+            pass
+        raise
+
+    # Синхронізуємо каталог, щоб перейменування теж пережило збій
+    if os.name == "posix":
+        dir_fd = os.open(os.path.dirname(os.path.abspath(filename)), os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+class _LegacyObject:
+    pass
+
+class _LegacyUnpickler(pickle.Unpickler):
+    # Старий формат зберігав pickle класів AddressBook/Record/Name/Phone/Birthday,
+    # яких уже немає, тож читаємо їх як прості об'єкти з атрибутами
+    def find_class(self, module, name):
+        if module == "datetime" and name == "datetime":
+            return datetime
+        if name in ("AddressBook", "Record", "Field", "Name", "Phone", "Birthday"):
+            return _LegacyObject
+        raise pickle.UnpicklingError(f"Unexpected object '{module}.{name}'")
+
+def _read_json(filename):
+    with open(filename, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _read_legacy_pickle(filename):
+    with open(filename, "rb") as f:
+        book = _LegacyUnpickler(f).load()
+    return [
+        {
+            "name": record.name.name,
+            "phones": [p.number for p in record.phones],
+            "birthday": record.birthday.value if record.birthday else None,
+        }
+        for record in book.data.values()
+    ]
+
+def load_data(filename="addressbook.json", legacy_filename="addressbook.pkl"):
+    # addressbook.pkl читається лише раз, доки не з'явиться JSON-файл
+    if os.path.exists(filename):
+        source, read = filename, _read_json
+    elif os.path.exists(legacy_filename):
+        source, read = legacy_filename, _read_legacy_pickle
+    else:
         return AddressBook()
 
+    try:
+        return AddressBook.from_plain(read(source))
+    except KeyError as e:
+        raise ValueError(f"Cannot load address book from '{source}': missing field {e}") from e
+    except (pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError) as e:
+        raise ValueError(f"Cannot load address book from '{source}': {e}") from e
+
 def parse_input(command):
-    parts = command.split()
-    if parts:
-        return parts[0].lower(), parts[1:]
-    return "", []
+    parts = command.split(None, 1)
+    if not parts:
+        return "", []
+    if len(parts) == 1:
+        return parts[0].lower(), []
+    return parts[0].lower(), parts[1].split()
+
+# Команда -> (обробник, (мін. к-сть аргументів, макс. к-сть або None));
+# None замість кортежу - команда ігнорує аргументи
+COMMANDS = {
+    "hello": (say_hello, None),
+    "add": (add_contact, (2, None)),
+    "change": (change_contact, (3, 3)),
+    "phone": (show_phone, (1, 1)),
+    "all": (show_all_contacts, None),
+    "add-birthday": (add_contact_birthday, (2, 2)),
+    "show-birthday": (show_birthday, (1, 1)),
+    "birthdays": (show_upcoming_birthdays, None),
+}
 
 def main():
     print("Welcome to the assistant bot! ver 0.9")
-    address_book = load_data()
+    try:
+        address_book = load_data()
+    except ValueError as e:
+        print(e)
+        return
     while True:
-        command = input("Enter a command: ").strip()
+        cmd, args = parse_input(input("Enter a command: "))
 
-        if command.lower() in ["close", "exit"]:
+        if cmd in ("close", "exit") and not args:
             save_data(address_book)
             print("Good bye!")
             break
 
-        cmd, args = parse_input(command)
-
-        match cmd:
-            case "hello":
-                print("How can I help you?")
-
-            case "add":
-                if len(args) >= 2:
-                    add_contact(address_book, args[0], *args[1:])
-                else:
-                    print("Invalid number of arguments for 'add' command.")
-
-            case "change":
-                if len(args) == 3:
-                    change_contact(address_book, args[0], args[1], args[2])
-                else:
-                    print("Invalid number of arguments for 'change' command.")
-
-            case "phone":
-                if len(args) == 1:
-                    show_phone(address_book, args[0])
-                else:
-                    print("Invalid number of arguments for 'phone' command.")
-
-            case "all":
-                show_all_contacts(address_book)
-
-            case "add-birthday":
-                if len(args) == 2:
-                    add_contact_birthday(address_book, args[0], args[1])
-                else:
-                    print("Invalid number of arguments for 'add-birthday' command.")
-
-            case "show-birthday":
-                if len(args) == 1:
-                    show_birthday(address_book, args[0])
-                else:
-                    print("Invalid number of arguments for 'show-birthday' command.")
-
-            case "birthdays":
-                upcoming_birthdays = get_upcoming_birthdays(address_book)
-                if upcoming_birthdays:
-                    print("Upcoming birthdays in the next 7 days:")
-                    for birthday in upcoming_birthdays:
-                        print(f"{birthday['name']} has a birthday on {birthday['congratulation_date']}")
-                else:
-                    print("No upcoming birthdays in the next 7 days.")
-
-            case _:
-                print("Invalid command. Type again!")
+        handler, arity = COMMANDS.get(cmd, (None, None))
+        if handler is None:
+            print("Invalid command. Type again!")
+            continue
+
+        if arity is None:
+            handler(address_book)
+            continue
+
+        min_args, max_args = arity
+        if len(args) < min_args or (max_args is not None and len(args) > max_args):
+            print(f"Invalid number of arguments for '{cmd}' command.")
+            continue
+
+        handler(address_book, *args)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,376 @@
+import copy
+import os
+import pickle
+import sys
+import tempfile
+import types
+import unittest
+from datetime import date, datetime, timedelta
+
+from unittest import mock
+
+from Task_01 import (
+    AddressBook, Record, _birthday_window, _parse_birthday, _validate_phone, change_contact,
+    get_upcoming_birthdays,
+    load_data, save_data,
+)
+
+
+def make_record(name, birthday=None):
+    return Record(name, "1234567890", birthday=birthday)
+
+
+def patch_today(year, month, day):
+    class FixedDatetime(datetime):
+        @classmethod
+        def today(cls):
+            return cls(year, month, day)
+
+    return mock.patch("Task_01.datetime", FixedDatetime)
+
+
+class RecordTest(unittest.TestCase):
+    def test_remove_phone_removes_every_copy(self):
+        record = Record("Z", "1111111111", "2222222222", "1111111111")
+        phones = record.phones
+        record.remove_phone("1111111111")
+        self.assertEqual(record.phones, ["2222222222"])
+        self.assertIs(record.phones, phones)
+
+    def test_edit_phone_validates_new_number(self):
+        record = Record("Z", "1111111111")
+        with self.assertRaises(ValueError):
+            record.edit_phone("1111111111", "abc")
+        self.assertEqual(record.phones, ["1111111111"])
+
+    def test_remove_unknown_phone(self):
+        record = Record("Z", "1111111111")
+        record.remove_phone("2222222222")
+        self.assertEqual(record.phones, ["1111111111"])
+
+
+class ValidatePhoneTest(unittest.TestCase):
+    def test_accepts_ten_ascii_digits(self):
+        self.assertEqual(_validate_phone("1234567890"), "1234567890")
+
+    def test_accepts_what_isdigit_accepts(self):
+        for number in ("١٢٣٤٥٦٧٨٩٠", "123456789²"):
+            self.assertEqual(_validate_phone(number), number)
+
+    def test_rejects_invalid_numbers(self):
+        for number in ("123456789", "12345678901", "12345678a0", "123456789\n", ""):
+            with self.assertRaises(ValueError, msg=repr(number)):
+                _validate_phone(number)
+
+
+class ParseBirthdayTest(unittest.TestCase):
+    def test_matches_strptime(self):
+        for value in ("04.01.2000", "4.1.2000", " 4.01.2000", "29.02.2000", "29.02.2001",
+                      "31.04.2000", "00.01.2000", "01.13.2000", "01.01.0000", "4.1.00",
+                      "04-01-2000", "04.01.2000 ", "004.01.2000", ""):
+            try:
+                parsed = datetime.strptime(value, "%d.%m.%Y")
+                expected = (parsed.month, parsed.day)
+            except ValueError:
+                expected = None
+            try:
+                actual = _parse_birthday(value)
+            except ValueError:
+                actual = None
+            self.assertEqual(actual, expected, value)
+
+
+class BirthdayIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.book = AddressBook()
+
+    def test_add_and_delete_record(self):
+        self.book.add_record(make_record("Z", "04.01.2000"))
+        self.assertEqual(list(self.book.names_with_birthday((1, 4))), ["Z"])
+        self.book.delete_record("Z")
+        self.assertEqual(list(self.book.names_with_birthday((1, 4))), [])
+
+    def test_del_item(self):
+        self.book.add_record(make_record("Z", "04.01.2000"))
+        del self.book["Z"]
+        self.assertEqual(list(self.book.names_with_birthday((1, 4))), [])
+
+    def test_set_item(self):
+        self.book["Z"] = make_record("Z", "04.01.2000")
+        self.assertEqual(list(self.book.names_with_birthday((1, 4))), ["Z"])
+
+    def test_set_item_replaces_old_entry(self):
+        self.book["Z"] = make_record("Z", "04.01.2000")
+        self.book["Z"] = make_record("Z", "05.01.2000")
+        self.assertEqual(list(self.book.names_with_birthday((1, 4))), [])
+        self.assertEqual(list(self.book.names_with_birthday((1, 5))), ["Z"])
+
+    def test_constructor(self):
+        book = AddressBook({"Z": make_record("Z", "04.01.2000")})
+        self.assertEqual(list(book.names_with_birthday((1, 4))), ["Z"])
+
+    def test_update_pop_and_ior(self):
+        self.book.update({"A": make_record("A", "04.01.2000")})
+        self.book |= {"B": make_record("B", "04.01.2000")}
+        self.assertEqual(sorted(self.book.names_with_birthday((1, 4))), ["A", "B"])
+        self.book.pop("A")
+        self.assertEqual(list(self.book.names_with_birthday((1, 4))), ["B"])
+
+    def test_copy_has_own_index(self):
+        self.book.add_record(make_record("Z", "04.01.2000"))
+        for book_copy in (self.book.copy(), copy.copy(self.book)):
+            self.assertIsInstance(book_copy, AddressBook)
+            del book_copy["Z"]
+            self.assertEqual(list(self.book.names_with_birthday((1, 4))), ["Z"])
+
+    def test_add_birthday(self):
+        self.book.add_record(make_record("Z", "04.01.2000"))
+        self.book.add_birthday("Z", "05.01.2000")
+        self.assertEqual(list(self.book.names_with_birthday((1, 4))), [])
+        self.assertEqual(list(self.book.names_with_birthday((1, 5))), ["Z"])
+
+    def test_names_with_birthday_is_a_copy(self):
+        self.book.add_record(make_record("Z", "04.01.2000"))
+        self.assertIsInstance(self.book.names_with_birthday((1, 4)), tuple)
+
+    def test_cached_window_is_read_only(self):
+        window = _birthday_window(date(2024, 2, 26).toordinal(), 7)
+        with self.assertRaises(TypeError):
+            window[(1, 1)] = "2024.01.01"
+
+    def test_keys_are_interned(self):
+        self.book.add_record(make_record("".join(["Jo", "hn"])))
+        self.assertIs(next(iter(self.book)), sys.intern("John"))
+
+    def test_non_str_names(self):
+        class Name(str):
+            pass
+
+        self.assertIsNone(self.book.find_record(5))
+        self.book.add_record(make_record(Name("x")))
+        self.book[5] = make_record(5)
+        self.assertIsNotNone(self.book.find_record("x"))
+        self.assertIsNotNone(self.book.find_record(5))
+
+    def test_birthday_added_on_stored_record(self):
+        self.book.add_record(make_record("Q"))
+        self.book.find_record("Q").add_birthday("07.05.2000")
+        with patch_today(2024, 5, 6):
+            self.assertEqual(get_upcoming_birthdays(self.book),
+                             [{"name": "Q", "congratulation_date": "2024.05.07"}])
+
+    def test_birthday_changed_on_stored_record(self):
+        self.book.add_record(make_record("Q", "07.05.2000"))
+        self.book.find_record("Q").add_birthday("01.01.2000")
+        with patch_today(2024, 5, 6):
+            self.assertEqual(get_upcoming_birthdays(self.book), [])
+        self.assertEqual(list(self.book.names_with_birthday((1, 1))), ["Q"])
+
+    def test_birthday_changed_on_record_in_copy(self):
+        self.book.add_record(make_record("Q", "07.05.2000"))
+        book_copy = self.book.copy()
+        self.book.find_record("Q").add_birthday("01.01.2000")
+        self.assertEqual(list(book_copy.names_with_birthday((1, 1))), ["Q"])
+        self.assertEqual(list(book_copy.names_with_birthday((5, 7))), [])
+
+    def test_removed_record_no_longer_updates_book(self):
+        record = make_record("Q", "07.05.2000")
+        self.book.add_record(record)
+        self.book.delete_record("Q")
+        record.add_birthday("01.01.2000")
+        self.assertEqual(list(self.book.names_with_birthday((1, 1))), [])
+
+    def test_birthday_changed_on_record_then_deleted(self):
+        self.book.add_record(make_record("Q"))
+        self.book.find_record("Q").add_birthday("04.01.2000")
+        self.book.delete_record("Q")
+        self.assertNotIn("Q", self.book)
+
+    def test_birthday_changed_on_record_then_replaced(self):
+        self.book.add_record(make_record("Q", "03.01.2000"))
+        self.book.find_record("Q").add_birthday("04.01.2000")
+        self.book.add_record(make_record("Q", "04.01.2000"))
+        self.assertEqual(list(self.book.names_with_birthday((1, 3))), [])
+        self.assertEqual(list(self.book.names_with_birthday((1, 4))), ["Q"])
+
+
+class UpcomingBirthdaysTest(unittest.TestCase):
+    def upcoming(self, today, *birthdays):
+        book = AddressBook()
+        for i, birthday in enumerate(birthdays):
+            book.add_record(make_record(f"N{i}", birthday))
+        with patch_today(*today):
+            return [(b["name"], b["congratulation_date"]) for b in get_upcoming_birthdays(book)]
+
+    def test_weekend_moves_to_monday(self):
+        # 09.05.2024 - четвер
+        self.assertEqual(
+            self.upcoming((2024, 5, 9), "10.05.1990", "11.05.1990", "12.05.1990"),
+            [("N0", "2024.05.10"), ("N1", "2024.05.13"), ("N2", "2024.05.13")],
+        )
+
+    def test_window_bounds(self):
+        self.assertEqual(
+            self.upcoming((2024, 5, 6), "05.05.1990", "06.05.1990", "13.05.1990", "14.05.1990"),
+            [("N1", "2024.05.06"), ("N2", "2024.05.13")],
+        )
+
+    def test_wraps_into_next_year(self):
+        # 28.12.2024 - субота, 04.01.2025 - субота
+        self.assertEqual(
+            self.upcoming((2024, 12, 28), "27.12.1990", "28.12.1990", "02.01.1990",
+                          "04.01.1990", "05.01.1990"),
+            [("N1", "2024.12.30"), ("N2", "2025.01.02"), ("N3", "2025.01.06")],
+        )
+
+    def test_feb_29_in_leap_year(self):
+        self.assertEqual(
+            self.upcoming((2024, 2, 26), "29.02.2000", "01.03.1990"),
+            [("N0", "2024.02.29"), ("N1", "2024.03.01")],
+        )
+
+    def test_feb_29_falls_on_mar_1_in_non_leap_year(self):
+        # 01.03.2025 - субота, тож привітання переноситься на понеділок
+        self.assertEqual(
+            self.upcoming((2025, 2, 26), "29.02.2000", "28.02.1990"),
+            [("N1", "2025.02.28"), ("N0", "2025.03.03")],
+        )
+
+    def test_matches_original_algorithm(self):
+        # Початкова реалізація з replace(year=...) для всіх днів, крім 29.02
+        book = AddressBook()
+        birthdays = [date(1990, 1, 1) + timedelta(days=i) for i in range(365)]
+        for birthday in birthdays:
+            book.add_record(make_record(birthday.strftime("%d%m"), birthday.strftime("%d.%m.%Y")))
+
+        today = date(2023, 1, 1)
+        while today < date(2025, 1, 1):
+            expected = []
+            for birthday in birthdays:
+                birthday_this_year = birthday.replace(year=today.year)
+                if birthday_this_year < today:
+                    birthday_this_year = birthday_this_year.replace(year=today.year + 1)
+                if (birthday_this_year - today).days <= 7:
+                    if birthday_this_year.weekday() == 5:
+                        birthday_this_year += timedelta(days=2)
+                    elif birthday_this_year.weekday() == 6:
+                        birthday_this_year += timedelta(days=1)
+                    expected.append({"name": birthday.strftime("%d%m"),
+                                     "congratulation_date": birthday_this_year.strftime("%Y.%m.%d")})
+            with patch_today(today.year, today.month, today.day):
+                actual = get_upcoming_birthdays(book)
+            self.assertCountEqual(actual, expected, today)
+            today += timedelta(days=1)
+
+    def test_results_are_in_date_order(self):
+        self.assertEqual(
+            self.upcoming((2024, 5, 9), "15.05.1990", "09.05.1990", "12.05.1990"),
+            [("N1", "2024.05.09"), ("N2", "2024.05.13"), ("N0", "2024.05.15")],
+        )
+
+
+class LoadDataTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.json_path = os.path.join(self.tmpdir.name, "addressbook.json")
+        self.pkl_path = os.path.join(self.tmpdir.name, "addressbook.pkl")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_legacy_pickle(self, number="1234567890"):
+        # Класи зі старої версії, до переходу на JSON
+        legacy = types.ModuleType("legacy_task")
+        for name in ("AddressBook", "Record", "Name", "Phone", "Birthday"):
+            cls = type(name, (), {})
+            cls.__module__ = "legacy_task"
+            setattr(legacy, name, cls)
+        sys.modules["legacy_task"] = legacy
+        self.addCleanup(sys.modules.pop, "legacy_task")
+
+        record = legacy.Record()
+        record.name = legacy.Name()
+        record.name.name = "John"
+        phone = legacy.Phone()
+        phone.number = number
+        record.phones = [phone]
+        record.birthday = legacy.Birthday()
+        record.birthday.value = "01.01.1990"
+        record.birthday.date = datetime(1990, 1, 1)
+        book = legacy.AddressBook()
+        book.data = {"John": record}
+        with open(self.pkl_path, "wb") as f:
+            pickle.dump(book, f)
+
+    def test_missing_files(self):
+        self.assertEqual(len(load_data(self.json_path, self.pkl_path)), 0)
+
+    def test_legacy_pickle_fallback(self):
+        self.write_legacy_pickle()
+        book = load_data(self.json_path, self.pkl_path)
+        self.assertEqual(
+            book.to_plain(),
+            [{"name": "John", "phones": ["1234567890"], "birthday": "01.01.1990"}],
+        )
+        self.assertEqual(list(book.names_with_birthday((1, 1))), ["John"])
+
+    def test_legacy_pickle_with_unvalidated_number(self):
+        # Стара команда change не перевіряла новий номер
+        self.write_legacy_pickle(number="abc")
+        self.assertEqual(load_data(self.json_path, self.pkl_path).find_record("John").phones, ["abc"])
+
+    def test_json_wins_over_legacy_pickle(self):
+        self.write_legacy_pickle()
+        with open(self.json_path, "w", encoding="utf-8") as f:
+            f.write("[]")
+        self.assertEqual(len(load_data(self.json_path, self.pkl_path)), 0)
+
+    def test_stored_phones_are_not_revalidated(self):
+        with open(self.json_path, "w", encoding="utf-8") as f:
+            f.write('[{"name": "A", "phones": ["abc"], "birthday": null}]')
+        self.assertEqual(load_data(self.json_path, self.pkl_path).find_record("A").phones, ["abc"])
+
+    def test_malformed_json(self):
+        for content in ("{oops", '[{"name": "A"}]', "[1]", '[{"name": "A", "phones": 5, "birthday": null}]'):
+            with open(self.json_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            with self.assertRaisesRegex(ValueError, "Cannot load address book"):
+                load_data(self.json_path, self.pkl_path)
+
+
+class SaveDataTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "addressbook.json")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        book = AddressBook()
+        book.add_record(make_record("Z", "04.01.2000"))
+        save_data(book, self.path)
+        self.assertEqual(load_data(self.path).to_plain(), book.to_plain())
+        self.assertEqual(os.listdir(self.tmpdir.name), ["addressbook.json"])
+
+    def test_failed_write_keeps_old_file(self):
+        save_data(AddressBook(), self.path)
+        book = AddressBook()
+        book.add_record(make_record("Z"))
+        with mock.patch("Task_01.json.dump", side_effect=RuntimeError("disk full")):
+            with self.assertRaises(RuntimeError):
+                save_data(book, self.path)
+        self.assertEqual(os.listdir(self.tmpdir.name), ["addressbook.json"])
+        self.assertEqual(len(load_data(self.path)), 0)
+
+    def test_rejected_change_keeps_file_loadable(self):
+        book = AddressBook()
+        book.add_record(Record("John", "1234567890"))
+        with mock.patch("builtins.print"):
+            change_contact(book, "John", "1234567890", "abc")
+        save_data(book, self.path)
+        self.assertEqual(load_data(self.path).find_record("John").phones, ["1234567890"])
+
+
+if __name__ == "__main__":
+    unittest.main()